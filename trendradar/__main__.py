@@ -6,24 +6,63 @@ Trending news aggregation and analysis tool
 Usage: python -m trendradar
 """
 
+import asyncio
+import functools
 import os
-import webbrowser
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-import requests
-
 from trendradar.context import AppContext
 from trendradar import __version__
 from trendradar.core import load_config
 from trendradar.crawler import DataFetcher
+from trendradar.reliability import get_breaker
 from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.manager import is_docker, is_github_actions
+
+
+# Shared HTTP session (created on first use): reuses pooled connections across outbound calls
+_HTTP_SESSION = None
+
+
+def _get_http_session():
+    """Get the shared HTTP session, creating it on first use"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+        session.mount(
+            "http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+@functools.lru_cache(maxsize=32)
+def parse_version(version_str: str) -> Tuple[int, int, int]:
+    """Parse a "major.minor.patch" version string, (0, 0, 0) if invalid"""
+    try:
+        parts = version_str.strip().split(".")
+        if len(parts) != 3:
+            raise ValueError("Invalid version format")
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    except (ValueError, AttributeError):
+        return 0, 0, 0
 
 
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Check for version updates"""
+    from trendradar.utils.http import retry_get
+
     try:
         proxies = None
         if proxy_url:
@@ -35,24 +74,29 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
-        )
-        response.raise_for_status()
+        def fetch_version() -> bytes:
+            response = retry_get(
+                _get_http_session(),
+                version_url,
+                proxies=proxies,
+                headers=headers,
+                timeout=10,
+                stream=True,
+            )
+            try:
+                response.raise_for_status()
+                # Version payload is a few bytes, read at most 64 to bound memory
+                return next(response.iter_content(64), b"")
+            finally:
+                response.close()
 
-        remote_version = response.text.strip()
+        # Skip the request entirely while the endpoint keeps failing
+        raw = get_breaker(f"version:{version_url}").call(fetch_version)
+
+        remote_version = raw.decode("ascii", "ignore").strip()
         print(f"Current version: {current_version}, Remote version: {remote_version}")
 
         # Compare versions
-        def parse_version(version_str):
-            try:
-                parts = version_str.strip().split(".")
-                if len(parts) != 3:
-                    raise ValueError("Invalid version format")
-                return int(parts[0]), int(parts[1]), int(parts[2])
-            except:
-                return 0, 0, 0
-
         current_tuple = parse_version(current_version)
         remote_tuple = parse_version(remote_version)
 
@@ -64,39 +108,52 @@ def check_version_update(
         return False, None
 
 
+@dataclass(frozen=True, slots=True)
+class ModeStrategy:
+    """Report mode strategy"""
+
+    mode_name: str
+    description: str
+    realtime_report_type: str
+    summary_report_type: str
+    should_send_realtime: bool
+    should_generate_summary: bool
+    summary_mode: str
+
+
 # === Main Analyzer ===
 class NewsAnalyzer:
     """News Analyzer"""
 
     # Mode strategy definitions
     MODE_STRATEGIES = {
-        "incremental": {
-            "mode_name": "Incremental Mode",
-            "description": "Incremental mode (only new news, no push if nothing new)",
-            "realtime_report_type": "Real-time Incremental",
-            "summary_report_type": "Daily Summary",
-            "should_send_realtime": True,
-            "should_generate_summary": True,
-            "summary_mode": "daily",
-        },
-        "current": {
-            "mode_name": "Current Rankings Mode",
-            "description": "Current rankings mode (current matches + new news section + scheduled push)",
-            "realtime_report_type": "Real-time Current Rankings",
-            "summary_report_type": "Current Rankings Summary",
-            "should_send_realtime": True,
-            "should_generate_summary": True,
-            "summary_mode": "current",
-        },
-        "daily": {
-            "mode_name": "Daily Summary Mode",
-            "description": "Daily summary mode (all matches + new news section + scheduled push)",
-            "realtime_report_type": "",
-            "summary_report_type": "Daily Summary",
-            "should_send_realtime": False,
-            "should_generate_summary": True,
-            "summary_mode": "daily",
-        },
+        "incremental": ModeStrategy(
+            mode_name="Incremental Mode",
+            description="Incremental mode (only new news, no push if nothing new)",
+            realtime_report_type="Real-time Incremental",
+            summary_report_type="Daily Summary",
+            should_send_realtime=True,
+            should_generate_summary=True,
+            summary_mode="daily",
+        ),
+        "current": ModeStrategy(
+            mode_name="Current Rankings Mode",
+            description="Current rankings mode (current matches + new news section + scheduled push)",
+            realtime_report_type="Real-time Current Rankings",
+            summary_report_type="Current Rankings Summary",
+            should_send_realtime=True,
+            should_generate_summary=True,
+            summary_mode="current",
+        ),
+        "daily": ModeStrategy(
+            mode_name="Daily Summary Mode",
+            description="Daily summary mode (all matches + new news section + scheduled push)",
+            realtime_report_type="",
+            summary_report_type="Daily Summary",
+            should_send_realtime=False,
+            should_generate_summary=True,
+            summary_mode="daily",
+        ),
     }
 
     def __init__(self):
@@ -113,18 +170,38 @@ class NewsAnalyzer:
         self.request_interval = self.ctx.config["REQUEST_INTERVAL"]
         self.report_mode = self.ctx.config["REPORT_MODE"]
         self.rank_threshold = self.ctx.rank_threshold
-        self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
-        self.is_docker_container = self._detect_docker_environment()
+        # Config is immutable for the run, so resolve these once
+        self._mode_strategy = self._get_mode_strategy()
+        self._has_notification = self._compute_has_notification()
+        # Analysis data cache, invalidated by bumping _data_version after each crawl save
+        self._analysis_cache: Dict[Tuple, Tuple] = {}
+        self._data_version = 0
+        self.is_github_actions = is_github_actions()
+        self.is_docker_container = is_docker()
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
+        # Platform list is fixed for the analyzer's lifetime
+        self._crawl_ids = [
+            (p["id"], p["name"]) if "name" in p else p["id"] for p in self.ctx.platforms
+        ]
+        self._platform_names = [p.get("name", p["id"]) for p in self.ctx.platforms]
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
 
-        if self.is_github_actions:
-            self._check_version_update()
+        # Version check runs in the background, overlapping with the crawl
+        self._version_thread: Optional[threading.Thread] = None
+        if (
+            self.is_github_actions
+            and self.ctx.config["SHOW_VERSION_UPDATE"]
+            and self.ctx.config["VERSION_CHECK_URL"]
+        ):
+            self._version_thread = threading.Thread(
+                target=self._check_version_update, daemon=True
+            )
+            self._version_thread.start()
 
     def _init_storage_manager(self) -> None:
         """Initialize storage manager (using AppContext)"""
@@ -141,23 +218,15 @@ class NewsAnalyzer:
         if retention_days > 0:
             print(f"Data retention: {retention_days} days")
 
-    def _detect_docker_environment(self) -> bool:
-        """Detect if running in Docker container"""
-        try:
-            if os.environ.get("DOCKER_CONTAINER") == "true":
-                return True
-
-            if os.path.exists("/.dockerenv"):
-                return True
-
-            return False
-        except Exception:
-            return False
-
     def _should_open_browser(self) -> bool:
         """Determine if browser should be opened"""
         return not self.is_github_actions and not self.is_docker_container
 
+    @staticmethod
+    def _file_url(path: str) -> str:
+        """Build a file:// URL for a local report path"""
+        return "file://" + str(Path(path).resolve())
+
     def _setup_proxy(self) -> None:
         """Set up proxy configuration"""
         if not self.is_github_actions and self.ctx.config["USE_PROXY"]:
@@ -186,11 +255,20 @@ class NewsAnalyzer:
         except Exception as e:
             print(f"Version check error: {e}")
 
-    def _get_mode_strategy(self) -> Dict:
+    def _get_update_info(self) -> Optional[Dict]:
+        """Get version update info to display (None if disabled or not yet known)"""
+        if not self.ctx.config["SHOW_VERSION_UPDATE"]:
+            return None
+        if self._version_thread is not None:
+            # Don't block on a slow version check, it has had the whole crawl to finish
+            self._version_thread.join(timeout=0.1)
+        return self.update_info
+
+    def _get_mode_strategy(self) -> ModeStrategy:
         """Get current mode strategy configuration"""
         return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
 
-    def _has_notification_configured(self) -> bool:
+    def _compute_has_notification(self) -> bool:
         """Check if any notification channel is configured"""
         cfg = self.ctx.config
         return any(
@@ -211,26 +289,24 @@ class NewsAnalyzer:
         )
 
     def _has_valid_content(
-        self, stats: List[Dict], new_titles: Optional[Dict] = None
+        self,
+        stats: List[Dict],
+        new_titles: Optional[Dict] = None,
+        has_new_titles: Optional[bool] = None,
     ) -> bool:
         """Check if there is valid news content"""
+        if has_new_titles is None:
+            has_new_titles = bool(new_titles) and any(new_titles.values())
+
         if self.report_mode == "incremental":
             # Incremental mode: must have new titles matching keywords
-            has_new_titles = bool(
-                new_titles and any(len(titles) > 0 for titles in new_titles.values())
-            )
-            has_matched_news = any(stat["count"] > 0 for stat in stats)
-            return has_new_titles and has_matched_news
+            return has_new_titles and any(stat["count"] > 0 for stat in stats)
         elif self.report_mode == "current":
             # Current mode: push if stats has any matched content
             return any(stat["count"] > 0 for stat in stats)
         else:
-            # Daily summary mode: check for matched keywords or new news
-            has_matched_news = any(stat["count"] > 0 for stat in stats)
-            has_new_news = bool(
-                new_titles and any(len(titles) > 0 for titles in new_titles.values())
-            )
-            return has_matched_news or has_new_news
+            # Daily summary mode: check for new news or matched keywords
+            return has_new_titles or any(stat["count"] > 0 for stat in stats)
 
     def _load_analysis_data(
         self,
@@ -240,6 +316,15 @@ class NewsAnalyzer:
         try:
             # Get current configured platform IDs
             current_platform_ids = self.ctx.platform_ids
+            cache_key = (
+                self.ctx.format_date(),
+                tuple(sorted(current_platform_ids)),
+                self._data_version,
+            )
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             if not quiet:
                 print(f"Current platforms: {current_platform_ids}")
 
@@ -258,7 +343,7 @@ class NewsAnalyzer:
             new_titles = self.ctx.detect_new_titles(current_platform_ids, quiet=quiet)
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
-            return (
+            analysis_data = (
                 all_results,
                 id_to_name,
                 title_info,
@@ -267,29 +352,28 @@ class NewsAnalyzer:
                 filter_words,
                 global_filters,
             )
+            self._analysis_cache = {cache_key: analysis_data}
+            return analysis_data
         except Exception as e:
             print(f"Data loading failed: {e}")
             return None
 
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """Build title info from current crawl results"""
-        title_info = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
+        return {
+            source_id: {
+                title: {
                     "first_time": time_info,
                     "last_time": time_info,
                     "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
+                    "ranks": title_data.get("ranks", ()),
+                    "url": title_data.get("url", ""),
+                    "mobileUrl": title_data.get("mobileUrl", ""),
                 }
-        return title_info
+                for title, title_data in titles_data.items()
+            }
+            for source_id, titles_data in results.items()
+        }
 
     def _run_analysis_pipeline(
         self,
@@ -331,7 +415,7 @@ class NewsAnalyzer:
                 id_to_name=id_to_name,
                 mode=mode,
                 is_daily_summary=is_daily_summary,
-                update_info=self.update_info if self.ctx.config["SHOW_VERSION_UPDATE"] else None,
+                update_info=self._get_update_info(),
             )
 
         return stats, html_file
@@ -347,15 +431,17 @@ class NewsAnalyzer:
         html_file_path: Optional[str] = None,
     ) -> bool:
         """Unified notification sending logic with all conditions"""
-        has_notification = self._has_notification_configured()
+        has_notification = self._has_notification
         cfg = self.ctx.config
+        has_new_titles = bool(new_titles) and any(new_titles.values())
 
         if (
             cfg["ENABLE_NOTIFICATION"]
             and has_notification
-            and self._has_valid_content(stats, new_titles)
+            and self._has_valid_content(stats, new_titles, has_new_titles)
         ):
-            # Push window control
+            # Push window control (one push manager for checks and recording)
+            push_manager = None
             if cfg["PUSH_WINDOW"]["ENABLED"]:
                 push_manager = self.ctx.create_push_manager()
                 time_range_start = cfg["PUSH_WINDOW"]["TIME_RANGE"]["START"]
@@ -379,7 +465,7 @@ class NewsAnalyzer:
             report_data = self.ctx.prepare_report(stats, failed_ids, new_titles, id_to_name, mode)
 
             # Whether to send version update info
-            update_info_to_send = self.update_info if cfg["SHOW_VERSION_UPDATE"] else None
+            update_info_to_send = self._get_update_info()
 
             # Use NotificationDispatcher to send to all channels
             dispatcher = self.ctx.create_notification_dispatcher()
@@ -398,11 +484,10 @@ class NewsAnalyzer:
 
             # Record push if successful and once_per_day is enabled
             if (
-                cfg["PUSH_WINDOW"]["ENABLED"]
+                push_manager is not None
                 and cfg["PUSH_WINDOW"]["ONCE_PER_DAY"]
                 and any(results.values())
             ):
-                push_manager = self.ctx.create_push_manager()
                 push_manager.record_push(report_type)
 
             return True
@@ -411,36 +496,30 @@ class NewsAnalyzer:
             print("⚠️ Warning: Notifications enabled but no channels configured, skipping")
         elif not cfg["ENABLE_NOTIFICATION"]:
             print(f"Skipping {report_type} notification: Notifications disabled")
-        elif (
-            cfg["ENABLE_NOTIFICATION"]
-            and has_notification
-            and not self._has_valid_content(stats, new_titles)
-        ):
-            mode_strategy = self._get_mode_strategy()
+        else:
+            # Notifications enabled and configured, but no valid content
+            mode_strategy = self._mode_strategy
             if "Real-time" in report_type or "实时" in report_type:
                 if self.report_mode == "incremental":
-                    has_new = bool(
-                        new_titles and any(len(titles) > 0 for titles in new_titles.values())
-                    )
-                    if not has_new:
+                    if not has_new_titles:
                         print("Skipping real-time notification: No new news detected in incremental mode")
                     else:
                         print("Skipping real-time notification: New news didn't match any keywords")
                 else:
                     print(
-                        f"Skipping real-time notification: No matched news in {mode_strategy['mode_name']}"
+                        f"Skipping real-time notification: No matched news in {mode_strategy.mode_name}"
                     )
             else:
                 print(
-                    f"Skipping {mode_strategy['summary_report_type']} notification: No valid news content"
+                    f"Skipping {mode_strategy.summary_report_type} notification: No valid news content"
                 )
 
         return False
 
-    def _generate_summary_report(self, mode_strategy: Dict) -> Optional[str]:
+    def _generate_summary_report(self, mode_strategy: ModeStrategy) -> Optional[str]:
         """Generate summary report (with notification)"""
         summary_type = (
-            "Current Rankings Summary" if mode_strategy["summary_mode"] == "current" else "Daily Summary"
+            "Current Rankings Summary" if mode_strategy.summary_mode == "current" else "Daily Summary"
         )
         print(f"Generating {summary_type} report...")
 
@@ -456,7 +535,7 @@ class NewsAnalyzer:
         # Run analysis pipeline
         stats, html_file = self._run_analysis_pipeline(
             all_results,
-            mode_strategy["summary_mode"],
+            mode_strategy.summary_mode,
             title_info,
             new_titles,
             word_groups,
@@ -472,8 +551,8 @@ class NewsAnalyzer:
         # Send notification
         self._send_notification_if_needed(
             stats,
-            mode_strategy["summary_report_type"],
-            mode_strategy["summary_mode"],
+            mode_strategy.summary_report_type,
+            mode_strategy.summary_mode,
             failed_ids=[],
             new_titles=new_titles,
             id_to_name=id_to_name,
@@ -523,7 +602,7 @@ class NewsAnalyzer:
             print("Crawler disabled (ENABLE_CRAWLER=False), exiting")
             return
 
-        has_notification = self._has_notification_configured()
+        has_notification = self._has_notification
         if not self.ctx.config["ENABLE_NOTIFICATION"]:
             print("Notifications disabled (ENABLE_NOTIFICATION=False), data crawling only")
         elif not has_notification:
@@ -531,27 +610,23 @@ class NewsAnalyzer:
         else:
             print("Notifications enabled, will send alerts")
 
-        mode_strategy = self._get_mode_strategy()
+        mode_strategy = self._mode_strategy
         print(f"Report mode: {self.report_mode}")
-        print(f"Run mode: {mode_strategy['description']}")
+        print(f"Run mode: {mode_strategy.description}")
 
     def _crawl_data(self) -> Tuple[Dict, Dict, List]:
         """Execute data crawling"""
-        ids = []
-        for platform in self.ctx.platforms:
-            if "name" in platform:
-                ids.append((platform["id"], platform["name"]))
-            else:
-                ids.append(platform["id"])
-
+        print(f"Configured platforms: {self._platform_names}")
+        concurrency = self.ctx.config.get("CRAWL_CONCURRENCY", 4)
         print(
-            f"Configured platforms: {[p.get('name', p['id']) for p in self.ctx.platforms]}"
+            f"Starting data crawl, request interval {self.request_interval}ms, concurrency {concurrency}"
         )
-        print(f"Starting data crawl, request interval {self.request_interval}ms")
         Path("output").mkdir(parents=True, exist_ok=True)
 
-        results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+        results, id_to_name, failed_ids = asyncio.run(
+            self.data_fetcher.crawl_websites_async(
+                self._crawl_ids, self.request_interval, concurrency=concurrency
+            )
         )
 
         # Convert to NewsData format and save to storage backend
@@ -564,30 +639,38 @@ class NewsAnalyzer:
         # Save to storage backend (SQLite)
         if self.storage_manager.save_news_data(news_data):
             print(f"Data saved to storage backend: {self.storage_manager.backend_name}")
+        # New data written, previously loaded analysis data is stale
+        self._data_version += 1
+
+        # With the default local data_dir, the TXT snapshot and the original
+        # TXT format share one path; keep only the original (cleaned titles)
+        legacy_txt = self.ctx.config["STORAGE"]["FORMATS"]["TXT"]
+        skip_snapshot = False
+        if legacy_txt:
+            title_path = self.ctx.get_output_path("txt", f"{crawl_time}.txt")
+            snapshot_path = self.storage_manager.get_txt_snapshot_path(news_data)
+            skip_snapshot = bool(snapshot_path) and (
+                Path(snapshot_path).resolve() == Path(title_path).resolve()
+            )
 
         # Save TXT snapshot (if enabled)
-        txt_file = self.storage_manager.save_txt_snapshot(news_data)
-        if txt_file:
-            print(f"TXT snapshot saved: {txt_file}")
+        if not skip_snapshot:
+            txt_file = self.storage_manager.save_txt_snapshot(news_data)
+            if txt_file:
+                print(f"TXT snapshot saved: {txt_file}")
 
         # Compatibility: also save to original TXT format
-        if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
+        if legacy_txt:
             title_file = self.ctx.save_titles(results, id_to_name, failed_ids)
             print(f"Titles saved to: {title_file}")
 
         return results, id_to_name, failed_ids
 
     def _execute_mode_strategy(
-        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+        self, mode_strategy: ModeStrategy, results: Dict, id_to_name: Dict, failed_ids: List
     ) -> Optional[str]:
         """Execute mode-specific logic"""
-        # Get current platform IDs
-        current_platform_ids = self.ctx.platform_ids
-
-        new_titles = self.ctx.detect_new_titles(current_platform_ids)
         time_info = self.ctx.format_time()
-        if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
-            self.ctx.save_titles(results, id_to_name, failed_ids)
         word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
         # In current mode, real-time push needs full historical data for complete statistics
@@ -628,10 +711,10 @@ class NewsAnalyzer:
 
                 # Send real-time notification (using full historical statistics)
                 summary_html = None
-                if mode_strategy["should_send_realtime"]:
+                if mode_strategy.should_send_realtime:
                     self._send_notification_if_needed(
                         stats,
-                        mode_strategy["realtime_report_type"],
+                        mode_strategy.realtime_report_type,
                         self.report_mode,
                         failed_ids=failed_ids,
                         new_titles=historical_new_titles,
@@ -642,6 +725,8 @@ class NewsAnalyzer:
                 print("❌ Critical error: Unable to read just-saved data file")
                 raise RuntimeError("Data consistency check failed: read failed after save")
         else:
+            # Current mode takes new titles from the analysis data instead
+            new_titles = self.ctx.detect_new_titles(self.ctx.platform_ids)
             title_info = self._prepare_current_title_info(results, time_info)
             stats, html_file = self._run_analysis_pipeline(
                 results,
@@ -659,10 +744,10 @@ class NewsAnalyzer:
 
             # Send real-time notification (if needed)
             summary_html = None
-            if mode_strategy["should_send_realtime"]:
+            if mode_strategy.should_send_realtime:
                 self._send_notification_if_needed(
                     stats,
-                    mode_strategy["realtime_report_type"],
+                    mode_strategy.realtime_report_type,
                     self.report_mode,
                     failed_ids=failed_ids,
                     new_titles=new_titles,
@@ -672,11 +757,11 @@ class NewsAnalyzer:
 
         # Generate summary report (if needed)
         summary_html = None
-        if mode_strategy["should_generate_summary"]:
-            if mode_strategy["should_send_realtime"]:
+        if mode_strategy.should_generate_summary:
+            if mode_strategy.should_send_realtime:
                 # If real-time notification sent, summary only generates HTML
                 summary_html = self._generate_summary_html(
-                    mode_strategy["summary_mode"]
+                    mode_strategy.summary_mode
                 )
             else:
                 # Daily mode: generate summary report with notification
@@ -684,14 +769,14 @@ class NewsAnalyzer:
 
         # Open browser (only in non-container environment)
         if self._should_open_browser() and html_file:
+            import webbrowser
+
+            file_url = self._file_url(summary_html or html_file)
             if summary_html:
-                summary_url = "file://" + str(Path(summary_html).resolve())
-                print(f"Opening summary report: {summary_url}")
-                webbrowser.open(summary_url)
+                print(f"Opening summary report: {file_url}")
             else:
-                file_url = "file://" + str(Path(html_file).resolve())
                 print(f"Opening HTML report: {file_url}")
-                webbrowser.open(file_url)
+            webbrowser.open(file_url)
         elif self.is_docker_container and html_file:
             if summary_html:
                 print(f"Summary report generated (Docker): {summary_html}")
@@ -705,7 +790,7 @@ class NewsAnalyzer:
         try:
             self._initialize_and_check_config()
 
-            mode_strategy = self._get_mode_strategy()
+            mode_strategy = self._mode_strategy
 
             results, id_to_name, failed_ids = self._crawl_data()
 
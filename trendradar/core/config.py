@@ -5,7 +5,75 @@ Configuration Utilities - Multi-account config parsing and validation
 Provides parsing, validation, and limiting for multi-account push configurations
 """
 
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Parsed multi-account configs keyed by (config_value, separator), LRU-evicted
+_PARSE_CACHE_MAXSIZE = 256
+_PARSE_CACHE: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parse_accounts(config_value: str, separator: str) -> Tuple[str, ...]:
+    """Parsing core, returns an immutable tuple so cached results can't be mutated"""
+    if not config_value:
+        return ()
+    # Single pass: strip each account and track whether any is non-empty.
+    # Empty strings are preserved for placeholders (e.g., ";token2" means first account has no token)
+    accounts = []
+    any_non_empty = False
+    for part in config_value.split(separator):
+        account = part.strip()
+        accounts.append(account)
+        if account:
+            any_non_empty = True
+    # Filter out if all are empty
+    return tuple(accounts) if any_non_empty else ()
+
+
+def _parse_multi_account_config_cached(config_value: str, separator: str) -> Tuple[str, ...]:
+    """Parse with the module-level LRU cache"""
+    key = (config_value, separator)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return cached
+
+    accounts = _parse_accounts(config_value, separator)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = accounts
+        _PARSE_CACHE.move_to_end(key)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return accounts
+
+
+def _config_cache_key(config_value: str, separator: str = ";") -> str:
+    """
+    Stable content hash of a multi-account config value
+
+    Lets callers detect "did this channel config change since last cycle?"
+    without reparsing or keeping the full string around.
+
+    Examples:
+        >>> _config_cache_key("url1;url2") == _config_cache_key("url1;url2")
+        True
+        >>> _config_cache_key("url1;url2") == _config_cache_key("url1;url2", ",")
+        False
+    """
+    data = f"{separator}\0{config_value or ''}".encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _parse_cache_clear() -> None:
+    """Clear the parse cache"""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
 
 
 def parse_multi_account_config(config_value: str, separator: str = ";") -> List[str]:
@@ -27,14 +95,12 @@ def parse_multi_account_config(config_value: str, separator: str = ";") -> List[
         >>> parse_multi_account_config("")
         []
     """
-    if not config_value:
-        return []
-    # Preserve empty strings for placeholders (e.g., ";token2" means first account has no token)
-    accounts = [acc.strip() for acc in config_value.split(separator)]
-    # Filter out if all are empty
-    if all(not acc for acc in accounts):
-        return []
-    return accounts
+    # Same config strings are parsed on every push cycle, parse once and copy
+    return list(_parse_multi_account_config_cached(config_value, separator))
+
+
+parse_multi_account_config.cache_key = _config_cache_key
+parse_multi_account_config.cache_clear = _parse_cache_clear
 
 
 def validate_paired_configs(
@@ -69,36 +135,39 @@ def validate_paired_configs(
         ... }, "Telegram", ["token", "chat_id"])
         (False, 0)
     """
-    # Filter out empty lists
-    non_empty_configs = {k: v for k, v in configs.items() if v}
-
-    if not non_empty_configs:
-        return True, 0
-
-    # Check required items
+    # Check required items (an empty required item means the channel isn't configured)
     if required_keys:
         for key in required_keys:
-            if key not in non_empty_configs or not non_empty_configs[key]:
-                return True, 0  # Required item is empty, treat as not configured
-
-    # Get lengths of all non-empty configs
-    lengths = {k: len(v) for k, v in non_empty_configs.items()}
-    unique_lengths = set(lengths.values())
-
-    if len(unique_lengths) > 1:
+            if not configs.get(key):
+                return True, 0
+
+    # Single pass over non-empty configs, stop at the first length mismatch
+    first_len = -1
+    mismatch = False
+    for value in configs.values():
+        if not value:
+            continue
+        if first_len < 0:
+            first_len = len(value)
+        elif len(value) != first_len:
+            mismatch = True
+            break
+
+    if mismatch:
         print(f"❌ {channel_name} config error: Paired config counts don't match, skipping this channel")
-        for key, length in lengths.items():
-            print(f"   - {key}: {length} items")
+        for key, value in configs.items():
+            if value:
+                print(f"   - {key}: {len(value)} items")
         return False, 0
 
-    return True, list(unique_lengths)[0] if unique_lengths else 0
+    return True, max(first_len, 0)
 
 
 def limit_accounts(
-    accounts: List[str],
+    accounts: Sequence[str],
     max_count: int,
     channel_name: str
-) -> List[str]:
+) -> Sequence[str]:
     """
     Limit account count
 
@@ -125,14 +194,14 @@ def limit_accounts(
     return accounts
 
 
-def get_account_at_index(accounts: List[str], index: int, default: str = "") -> str:
+def get_account_at_index(accounts: Sequence[str], index: int, default: str = "") -> str:
     """
     Safely get account value at specified index
 
     Returns default when index is out of range or account value is empty.
 
     Args:
-        accounts: Account list
+        accounts: Account list (list or tuple)
         index: Index
         default: Default value
 
@@ -147,6 +216,4 @@ def get_account_at_index(accounts: List[str], index: int, default: str = "") ->
         >>> get_account_at_index(["a"], 5, "default")
         'default'
     """
-    if index < len(accounts):
-        return accounts[index] if accounts[index] else default
-    return default
+    return (accounts[index] or default) if index < len(accounts) else default
@@ -54,6 +54,7 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "CRAWL_CONCURRENCY": _get_env_int("CRAWL_CONCURRENCY") or crawler_config.get("concurrency", 4),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enable_crawler", True),
@@ -7,8 +7,10 @@
 - 批量平台数据爬取
 - 自动重试机制
 - 代理支持
+- 并发爬取（asyncio）
 """
 
+import asyncio
 import json
 import random
 import time
@@ -16,6 +18,8 @@ from typing import Dict, List, Tuple, Optional, Union
 
 import requests
 
+from trendradar.utils.http import RETRYABLE_STATUS_CODES, backoff_delay
+
 
 class DataFetcher:
     """数据获取器"""
@@ -47,30 +51,35 @@ class DataFetcher:
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
 
+    @staticmethod
+    def _split_id_info(id_info: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """将 平台ID 或 (平台ID, 别名) 元组拆分为 (平台ID, 名称)"""
+        if isinstance(id_info, tuple):
+            return id_info
+        return id_info, id_info
+
     def fetch_data(
         self,
         id_info: Union[str, Tuple[str, str]],
         max_retries: int = 2,
         min_retry_wait: int = 3,
-        max_retry_wait: int = 5,
+        max_retry_wait: int = 30,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
 
+        重试采用带上限的指数退避（full jitter），4xx 错误（429 除外）不重试。
+
         Args:
             id_info: 平台ID 或 (平台ID, 别名) 元组
             max_retries: 最大重试次数
-            min_retry_wait: 最小重试等待时间（秒）
-            max_retry_wait: 最大重试等待时间（秒）
+            min_retry_wait: 退避基础等待时间（秒）
+            max_retry_wait: 退避等待上限（秒）
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
         """
-        if isinstance(id_info, tuple):
-            id_value, alias = id_info
-        else:
-            id_value = id_info
-            alias = id_value
+        id_value, alias = self._split_id_info(id_info)
 
         url = f"{self.api_url}?id={id_value}&latest"
 
@@ -101,11 +110,18 @@ class DataFetcher:
                 return data_text, id_value, alias
 
             except Exception as e:
+                retry_after = None
+                if isinstance(e, requests.HTTPError) and e.response is not None:
+                    if e.response.status_code not in RETRYABLE_STATUS_CODES:
+                        print(f"请求 {id_value} 失败: {e}")
+                        return None, id_value, alias
+                    retry_after = e.response.headers.get("Retry-After")
+
                 retries += 1
                 if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = backoff_delay(
+                        retries - 1, min_retry_wait, max_retry_wait, retry_after
+                    )
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
                     time.sleep(wait_time)
                 else:
@@ -134,45 +150,10 @@ class DataFetcher:
         failed_ids = []
 
         for i, id_info in enumerate(ids_list):
-            if isinstance(id_info, tuple):
-                id_value, name = id_info
-            else:
-                id_value = id_info
-                name = id_value
-
+            id_value, name = self._split_id_info(id_info)
             id_to_name[id_value] = name
             response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+            self._collect_response(id_value, response, results, failed_ids)
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
@@ -182,3 +163,94 @@ class DataFetcher:
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
+
+    async def crawl_websites_async(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int = 100,
+        concurrency: int = 4,
+    ) -> Tuple[Dict, Dict, List]:
+        """
+        并发爬取多个网站数据
+
+        所有平台共用同一个 API 主机，由固定数量的并发槽位依次领取平台；
+        请求间隔只在每个槽位内部的相邻请求之间生效，而不是全局串行等待。
+        单个平台的耗时由 fetch_data 的请求超时与重试次数约束。
+
+        Args:
+            ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
+            request_interval: 同一槽位内相邻请求的间隔（毫秒）
+            concurrency: 最大并发请求数
+
+        Returns:
+            (结果字典, ID到名称的映射, 失败ID列表) 元组，与 crawl_websites 一致
+        """
+        responses: List[Optional[str]] = [None] * len(ids_list)
+        pending = iter(enumerate(ids_list))
+
+        async def worker():
+            first = True
+            for index, id_info in pending:
+                if not first:
+                    # 槽位内请求间隔，避免对同一主机突发请求
+                    actual_interval = max(50, request_interval + random.randint(-10, 20))
+                    await asyncio.sleep(actual_interval / 1000)
+                first = False
+                response, _, _ = await asyncio.to_thread(self.fetch_data, id_info)
+                responses[index] = response
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(max(1, concurrency), len(ids_list))))
+        )
+
+        results = {}
+        id_to_name = {}
+        failed_ids = []
+
+        for id_info, response in zip(ids_list, responses):
+            id_value, name = self._split_id_info(id_info)
+            id_to_name[id_value] = name
+            self._collect_response(id_value, response, results, failed_ids)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
+
+    @staticmethod
+    def _collect_response(
+        id_value: str,
+        response: Optional[str],
+        results: Dict,
+        failed_ids: List,
+    ) -> None:
+        """解析单个平台的响应文本，写入结果字典或失败列表"""
+        if not response:
+            failed_ids.append(id_value)
+            return
+
+        try:
+            data = json.loads(response)
+            results[id_value] = {}
+
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in results[id_value]:
+                    results[id_value][title]["ranks"].append(index)
+                else:
+                    results[id_value][title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            failed_ids.append(id_value)
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            failed_ids.append(id_value)
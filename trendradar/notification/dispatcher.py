@@ -10,8 +10,14 @@
     results = dispatcher.dispatch_all(report_data, report_type, ...)
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import smtplib
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import requests
+
+from trendradar.reliability import get_breaker
 from trendradar.core.config import (
     get_account_at_index,
     limit_accounts,
@@ -30,6 +36,14 @@ from .senders import (
     send_to_wework,
 )
 
+# 计入熔断的发送异常：网络传输与上游服务错误
+_TRANSPORT_ERRORS = (
+    requests.RequestException,
+    smtplib.SMTPException,
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class NotificationDispatcher:
     """
@@ -37,8 +51,15 @@ class NotificationDispatcher:
 
     将多账号发送逻辑封装，提供简洁的 dispatch_all 接口。
     内部处理账号解析、数量限制、配对验证等逻辑。
+    各渠道相互独立，使用线程池并发发送。
     """
 
+    # 并发发送的最大线程数（渠道总数）
+    MAX_WORKERS = 8
+
+    # 所有渠道发送的总等待时间（秒），超时未完成的渠道视为发送失败
+    CHANNEL_TIMEOUT = 300
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -81,49 +102,36 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        args = (report_data, report_type, update_info, proxy_url, mode)
+        channels: List[Tuple[str, Callable[[], bool]]] = []
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("feishu", partial(self._send_feishu, *args)))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("dingtalk", partial(self._send_dingtalk, *args)))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("wework", partial(self._send_wework, *args)))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("telegram", partial(self._send_telegram, *args)))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("ntfy", partial(self._send_ntfy, *args)))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("bark", partial(self._send_bark, *args)))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            channels.append(("slack", partial(self._send_slack, *args)))
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -131,10 +139,85 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            channels.append(
+                ("email", partial(self._send_email, report_type, html_file_path))
+            )
+
+        return self._run_channels(channels)
+
+    def _run_channels(
+        self, channels: List[Tuple[str, Callable[[], bool]]]
+    ) -> Dict[str, bool]:
+        """
+        并发执行各渠道发送任务
+
+        Args:
+            channels: (渠道名, 发送函数) 列表
+
+        Returns:
+            Dict[str, bool]: 每个渠道的发送结果，顺序与 channels 一致
+        """
+        results = {}
+        if not channels:
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=min(len(channels), self.MAX_WORKERS))
+        try:
+            futures = [(name, executor.submit(func)) for name, func in channels]
+            # 所有渠道共用同一个截止时间，未完成的渠道视为发送失败
+            wait([future for _, future in futures], timeout=self.CHANNEL_TIMEOUT)
+            for name, future in futures:
+                if not future.done():
+                    print(f"{name} 通知发送超时（{self.CHANNEL_TIMEOUT}秒），视为失败")
+                    results[name] = False
+                    continue
+                try:
+                    results[name] = bool(future.result())
+                except Exception as e:
+                    print(f"{name} 通知发送异常: {e}")
+                    results[name] = False
+        finally:
+            # 不阻塞当前调用；但卡住的发送线程仍会在进程退出时被等待
+            executor.shutdown(wait=False)
 
         return results
 
+    @staticmethod
+    def _send_with_breaker(
+        key: str, label: str, send_func: Callable[[], bool]
+    ) -> bool:
+        """
+        通过熔断器发送到单个目标地址
+
+        Args:
+            key: 熔断器标识（目标 URL 等，仅以哈希形式持久化）
+            label: 日志中显示的名称（不包含敏感地址）
+            send_func: 无参发送函数
+
+        Returns:
+            bool: 是否发送成功（熔断中视为失败）
+
+        Raises:
+            发送函数抛出的异常：网络/上游错误计入熔断后重新抛出，其他异常不计入
+        """
+        breaker = get_breaker(f"notification:{key}", name=label)
+        # 目标持续失败时熔断，跳过本次发送
+        if not breaker.allow():
+            print(f"{label} 熔断中，跳过发送")
+            return False
+        try:
+            result = bool(send_func())
+        except _TRANSPORT_ERRORS:
+            # 仅网络/上游错误计入熔断，其他异常（如程序错误）照常抛出
+            breaker.record_failure()
+            raise
+
+        if result:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return result
+
     def _send_to_multi_accounts(
         self,
         channel_name: str,
@@ -164,7 +247,11 @@ class NotificationDispatcher:
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
+                result = self._send_with_breaker(
+                    account,
+                    f"{channel_name}{account_label}",
+                    partial(send_func, account, account_label=account_label, **kwargs),
+                )
                 results.append(result)
 
         return any(results) if results else False
@@ -283,18 +370,23 @@ class NotificationDispatcher:
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
-                    bot_token=token,
-                    chat_id=chat_id,
-                    report_data=report_data,
-                    report_type=report_type,
-                    update_info=update_info,
-                    proxy_url=proxy_url,
-                    mode=mode,
-                    account_label=account_label,
-                    batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
-                    batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                    split_content_func=self.split_content_func,
+                result = self._send_with_breaker(
+                    f"telegram:{token}:{chat_id}",
+                    f"Telegram{account_label}",
+                    partial(
+                        send_to_telegram,
+                        bot_token=token,
+                        chat_id=chat_id,
+                        report_data=report_data,
+                        report_type=report_type,
+                        update_info=update_info,
+                        proxy_url=proxy_url,
+                        mode=mode,
+                        account_label=account_label,
+                        batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
+                        batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
+                        split_content_func=self.split_content_func,
+                    ),
                 )
                 results.append(result)
 
@@ -333,18 +425,23 @@ class NotificationDispatcher:
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
-                    server_url=ntfy_server_url,
-                    topic=topic,
-                    token=token,
-                    report_data=report_data,
-                    report_type=report_type,
-                    update_info=update_info,
-                    proxy_url=proxy_url,
-                    mode=mode,
-                    account_label=account_label,
-                    batch_size=3800,
-                    split_content_func=self.split_content_func,
+                result = self._send_with_breaker(
+                    f"ntfy:{ntfy_server_url}/{topic}",
+                    f"ntfy{account_label}",
+                    partial(
+                        send_to_ntfy,
+                        server_url=ntfy_server_url,
+                        topic=topic,
+                        token=token,
+                        report_data=report_data,
+                        report_type=report_type,
+                        update_info=update_info,
+                        proxy_url=proxy_url,
+                        mode=mode,
+                        account_label=account_label,
+                        batch_size=3800,
+                        split_content_func=self.split_content_func,
+                    ),
                 )
                 results.append(result)
 
@@ -408,13 +505,18 @@ class NotificationDispatcher:
         html_file_path: Optional[str],
     ) -> bool:
         """发送邮件（保持原有逻辑，已支持多收件人）"""
-        return send_to_email(
-            from_email=self.config["EMAIL_FROM"],
-            password=self.config["EMAIL_PASSWORD"],
-            to_email=self.config["EMAIL_TO"],
-            report_type=report_type,
-            html_file_path=html_file_path,
-            custom_smtp_server=self.config.get("EMAIL_SMTP_SERVER", ""),
-            custom_smtp_port=self.config.get("EMAIL_SMTP_PORT", ""),
-            get_time_func=self.get_time_func,
+        return self._send_with_breaker(
+            f"email:{self.config.get('EMAIL_SMTP_SERVER', '')}:{self.config['EMAIL_FROM']}",
+            "邮件",
+            partial(
+                send_to_email,
+                from_email=self.config["EMAIL_FROM"],
+                password=self.config["EMAIL_PASSWORD"],
+                to_email=self.config["EMAIL_TO"],
+                report_type=report_type,
+                html_file_path=html_file_path,
+                custom_smtp_server=self.config.get("EMAIL_SMTP_SERVER", ""),
+                custom_smtp_port=self.config.get("EMAIL_SMTP_PORT", ""),
+                get_time_func=self.get_time_func,
+            ),
         )
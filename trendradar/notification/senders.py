@@ -31,6 +31,21 @@ import requests
 from .batch import add_batch_headers, get_max_batch_header_size
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
 
+# JSON 请求体序列化：优先使用 orjson（可选依赖），否则回退到标准库
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """序列化 JSON 请求体（orjson，直接返回 UTF-8 字节）"""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        """序列化 JSON 请求体（标准库回退，与 requests 的 json= 行为一致）"""
+        return json.dumps(obj).encode("utf-8")
+
 
 # === SMTP 邮件配置 ===
 SMTP_CONFIGS = {
@@ -138,7 +153,7 @@ def send_to_feishu(
 
         try:
             response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+                webhook_url, headers=headers, data=_dumps(payload), proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -238,7 +253,7 @@ def send_to_dingtalk(
 
         try:
             response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+                webhook_url, headers=headers, data=_dumps(payload), proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -347,7 +362,7 @@ def send_to_wework(
 
         try:
             response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+                webhook_url, headers=headers, data=_dumps(payload), proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -444,7 +459,7 @@ def send_to_telegram(
 
         try:
             response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+                url, headers=headers, data=_dumps(payload), proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -900,7 +915,8 @@ def send_to_bark(
         try:
             response = requests.post(
                 api_endpoint,
-                json=payload,
+                headers={"Content-Type": "application/json"},
+                data=_dumps(payload),
                 proxies=proxies,
                 timeout=30,
             )
@@ -1012,7 +1028,7 @@ def send_to_slack(
 
         try:
             response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+                webhook_url, headers=headers, data=_dumps(payload), proxies=proxies, timeout=30
             )
 
             # Slack Incoming Webhooks 成功时返回 "ok" 文本
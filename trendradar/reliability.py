@@ -0,0 +1,209 @@
+# coding=utf-8
+"""
+可靠性工具模块
+
+提供简单的熔断器（CLOSED → OPEN → HALF_OPEN），用于上游持续不可用时
+跳过请求，避免每次运行都耗尽完整的超时时间。
+
+熔断器状态持久化到 output/.circuit_breakers.json，跨进程（每次 cron 运行）
+累计失败次数；文件中的 key 为哈希值，不会落盘 webhook 等敏感地址。
+
+使用示例:
+    breaker = get_breaker("version:" + url)
+    response = breaker.call(lambda: session.get(url, timeout=10))
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+# 熔断器状态文件
+STATE_FILE = Path("output") / ".circuit_breakers.json"
+
+
+class CircuitOpenError(Exception):
+    """熔断器处于打开状态，请求被跳过"""
+
+
+class CircuitBreaker:
+    """
+    熔断器
+
+    - CLOSED: 正常放行，连续失败达到阈值后进入 OPEN
+    - OPEN: 直接拒绝，经过恢复期后进入 HALF_OPEN
+    - HALF_OPEN: 放行一次试探请求，成功则 CLOSED，失败则重新 OPEN
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_s: float = 1800,
+        state: Optional[Dict[str, Any]] = None,
+        on_change: Optional[Callable[["CircuitBreaker"], None]] = None,
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            name: 熔断器名称（用于日志）
+            failure_threshold: 连续失败多少次后打开
+            recovery_s: 打开后多少秒进入半开状态
+            state: 持久化的状态（可选）
+            on_change: 状态变化后的回调（用于持久化）
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_s = recovery_s
+        self._on_change = on_change
+        state = state or {}
+        self._state = state.get("state", self.CLOSED)
+        self._failures = int(state.get("failures", 0))
+        # 使用墙上时间，保证跨进程可比
+        self._opened_at = float(state.get("opened_at", 0.0))
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """当前状态（打开超过恢复期时视为半开）"""
+        with self._lock:
+            if self._state == self.OPEN and time.time() - self._opened_at >= self.recovery_s:
+                self._state = self.HALF_OPEN
+            return self._state
+
+    def to_dict(self) -> Dict[str, Any]:
+        """导出可持久化的状态"""
+        with self._lock:
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "opened_at": self._opened_at,
+            }
+
+    def allow(self) -> bool:
+        """是否放行请求"""
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        """记录一次成功，关闭熔断器"""
+        with self._lock:
+            changed = self._state != self.CLOSED or self._failures != 0
+            self._state = self.CLOSED
+            self._failures = 0
+        if changed and self._on_change:
+            self._on_change(self)
+
+    def record_failure(self) -> None:
+        """记录一次失败，达到阈值或半开试探失败时打开熔断器"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    print(f"[熔断器] {self.name} 连续失败 {self._failures} 次，{self.recovery_s:g} 秒内跳过请求")
+                self._state = self.OPEN
+                self._opened_at = time.time()
+        if self._on_change:
+            self._on_change(self)
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """
+        通过熔断器执行调用
+
+        Args:
+            func: 无参调用，抛出异常视为失败
+
+        Returns:
+            func 的返回值
+
+        Raises:
+            CircuitOpenError: 熔断器打开时直接抛出，不执行 func
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} 熔断中，跳过请求")
+        try:
+            result = func()
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+# 熔断器注册表（按 key 共享，状态持久化到 STATE_FILE）
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_stored_state: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _state_key(key: str) -> str:
+    """状态文件中的 key（哈希，避免落盘敏感地址）"""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def _load_state() -> Dict[str, Dict[str, Any]]:
+    """读取状态文件（调用方持有 _breakers_lock）"""
+    global _stored_state
+    if _stored_state is None:
+        try:
+            with open(STATE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _stored_state = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _stored_state = {}
+    return _stored_state
+
+
+def _save_state(key: str, breaker: CircuitBreaker) -> None:
+    """写回单个熔断器的状态（原子替换，失败时仅打印）"""
+    with _breakers_lock:
+        state = _load_state()
+        state[_state_key(key)] = breaker.to_dict()
+        try:
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STATE_FILE.with_name(f"{STATE_FILE.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, STATE_FILE)
+        except OSError as e:
+            print(f"[熔断器] 保存状态失败: {e}")
+
+
+def get_breaker(
+    key: str,
+    name: Optional[str] = None,
+    failure_threshold: int = 3,
+    recovery_s: float = 1800,
+) -> CircuitBreaker:
+    """
+    获取指定 key 的熔断器（不存在时从状态文件恢复或创建）
+
+    Args:
+        key: 熔断器标识（如 URL），仅以哈希形式持久化
+        name: 日志中显示的名称（默认使用 key）
+        failure_threshold: 连续失败多少次后打开（仅创建时生效）
+        recovery_s: 打开后多少秒进入半开状态（仅创建时生效）
+
+    Returns:
+        CircuitBreaker 实例
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name or key,
+                failure_threshold,
+                recovery_s,
+                state=_load_state().get(_state_key(key)),
+                on_change=lambda b: _save_state(key, b),
+            )
+            _breakers[key] = breaker
+        return breaker
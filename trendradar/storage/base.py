@@ -247,6 +247,18 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_txt_snapshot_path(self, data: NewsData) -> Optional[str]:
+        """
+        获取 TXT 快照的本地保存路径（不写入文件）
+
+        Args:
+            data: 新闻数据
+
+        Returns:
+            快照路径，如果不写入本地输出目录返回 None
+        """
+        return None
+
     @abstractmethod
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
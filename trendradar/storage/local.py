@@ -582,6 +582,11 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 检测新标题失败: {e}")
             return {}
 
+    def get_txt_snapshot_path(self, data: NewsData) -> Optional[str]:
+        """获取 TXT 快照路径: data_dir/<日期>/txt/<抓取时间>.txt"""
+        date_folder = self._format_date_folder(data.date)
+        return str(self.data_dir / date_folder / "txt" / f"{data.crawl_time}.txt")
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
         保存 TXT 快照
@@ -596,11 +601,8 @@ class LocalStorageBackend(StorageBackend):
             return None
 
         try:
-            date_folder = self._format_date_folder(data.date)
-            txt_dir = self.data_dir / date_folder / "txt"
-            txt_dir.mkdir(parents=True, exist_ok=True)
-
-            file_path = txt_dir / f"{data.crawl_time}.txt"
+            file_path = Path(self.get_txt_snapshot_path(data))
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(file_path, "w", encoding="utf-8") as f:
                 for source_id, news_list in data.items.items():
@@ -5,7 +5,9 @@ Storage Manager - Unified storage backend management
 Automatically selects appropriate storage backend based on environment and config
 """
 
+import functools
 import os
+import threading
 from typing import Optional
 
 from trendradar.storage.base import StorageBackend, NewsData
@@ -13,6 +15,53 @@ from trendradar.storage.base import StorageBackend, NewsData
 
 # Storage manager singleton
 _storage_manager: Optional["StorageManager"] = None
+_storage_manager_lock = threading.Lock()
+
+# Backend classes, imported on first use (remote requires boto3)
+_local_cls = None
+_remote_cls = None
+
+
+def _get_local_backend_cls():
+    """Get LocalStorageBackend class (imported once)"""
+    global _local_cls
+    if _local_cls is None:
+        from trendradar.storage.local import LocalStorageBackend as _local_cls
+    return _local_cls
+
+
+def _get_remote_backend_cls():
+    """Get RemoteStorageBackend class (imported once, raises ImportError without boto3)"""
+    global _remote_cls
+    if _remote_cls is None:
+        from trendradar.storage.remote import RemoteStorageBackend as _remote_cls
+    return _remote_cls
+
+
+# Runtime environment can't change within a process, detect once.
+# Tests can reset with is_docker.cache_clear() / is_github_actions.cache_clear()
+@functools.lru_cache(maxsize=1)
+def is_github_actions() -> bool:
+    """Detect if running in GitHub Actions environment"""
+    return os.environ.get("GITHUB_ACTIONS") == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def is_docker() -> bool:
+    """Detect if running in Docker container"""
+    # Method 1: Check /.dockerenv file
+    if os.path.exists("/.dockerenv"):
+        return True
+
+    # Method 2: Check cgroup (Linux)
+    try:
+        with open("/proc/1/cgroup", "r") as f:
+            return "docker" in f.read()
+    except (FileNotFoundError, PermissionError):
+        pass
+
+    # Method 3: Check environment variable
+    return os.environ.get("DOCKER_CONTAINER") == "true"
 
 
 class StorageManager:
@@ -26,6 +75,21 @@ class StorageManager:
     - Support pulling data from remote to local
     """
 
+    # Wrapper methods that forward directly to the backend. Once the backend is
+    # resolved they are rebound to the backend's bound methods on the instance.
+    _FORWARDED_METHODS = (
+        "save_news_data",
+        "get_today_all_data",
+        "get_latest_crawl_data",
+        "detect_new_titles",
+        "get_txt_snapshot_path",
+        "save_txt_snapshot",
+        "save_html_report",
+        "is_first_crawl_today",
+        "has_pushed_today",
+        "record_push",
+    )
+
     def __init__(
         self,
         backend_type: str = "auto",
@@ -67,33 +131,20 @@ class StorageManager:
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
+        self._backend_lock = threading.Lock()
 
-    @staticmethod
-    def is_github_actions() -> bool:
-        """Detect if running in GitHub Actions environment"""
-        return os.environ.get("GITHUB_ACTIONS") == "true"
-
-    @staticmethod
-    def is_docker() -> bool:
-        """Detect if running in Docker container"""
-        # Method 1: Check /.dockerenv file
-        if os.path.exists("/.dockerenv"):
-            return True
-
-        # Method 2: Check cgroup (Linux)
-        try:
-            with open("/proc/1/cgroup", "r") as f:
-                return "docker" in f.read()
-        except (FileNotFoundError, PermissionError):
-            pass
+        # Remote config merged with environment variables, resolved on first use
+        self._resolved_remote_config: Optional[dict] = None
+        self._has_remote_cached: Optional[bool] = None
 
-        # Method 3: Check environment variable
-        return os.environ.get("DOCKER_CONTAINER") == "true"
+    # Kept as class attributes for backward compatibility
+    is_github_actions = staticmethod(is_github_actions)
+    is_docker = staticmethod(is_docker)
 
     def _resolve_backend_type(self) -> str:
         """Resolve actual backend type to use"""
         if self.backend_type == "auto":
-            if self.is_github_actions():
+            if is_github_actions():
                 # GitHub Actions environment, check for remote storage config
                 if self._has_remote_config():
                     return "remote"
@@ -105,35 +156,41 @@ class StorageManager:
         return self.backend_type
 
     def _has_remote_config(self) -> bool:
-        """Check if valid remote storage config exists"""
-        # Check config or environment variables
-        bucket_name = self.remote_config.get("bucket_name") or os.environ.get("S3_BUCKET_NAME")
-        access_key = self.remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID")
-        secret_key = self.remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY")
-        endpoint = self.remote_config.get("endpoint_url") or os.environ.get("S3_ENDPOINT_URL")
+        """Check if valid remote storage config exists (resolved once, then cached)"""
+        if self._has_remote_cached is not None:
+            return self._has_remote_cached
 
-        # Debug logging
-        has_config = bool(bucket_name and access_key and secret_key and endpoint)
+        # Check config or environment variables
+        cfg = self._resolved_remote_config = {
+            "bucket_name": self.remote_config.get("bucket_name") or os.environ.get("S3_BUCKET_NAME", ""),
+            "access_key_id": self.remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
+            "secret_access_key": self.remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
+            "endpoint_url": self.remote_config.get("endpoint_url") or os.environ.get("S3_ENDPOINT_URL", ""),
+            "region": self.remote_config.get("region") or os.environ.get("S3_REGION", ""),
+        }
+
+        # Debug logging (only on first check)
+        has_config = bool(
+            cfg["bucket_name"] and cfg["access_key_id"] and cfg["secret_access_key"] and cfg["endpoint_url"]
+        )
         if not has_config:
             print(f"[Storage Manager] Remote storage config check failed:")
-            print(f"  - bucket_name: {'configured' if bucket_name else 'not configured'}")
-            print(f"  - access_key_id: {'configured' if access_key else 'not configured'}")
-            print(f"  - secret_access_key: {'configured' if secret_key else 'not configured'}")
-            print(f"  - endpoint_url: {'configured' if endpoint else 'not configured'}")
+            print(f"  - bucket_name: {'configured' if cfg['bucket_name'] else 'not configured'}")
+            print(f"  - access_key_id: {'configured' if cfg['access_key_id'] else 'not configured'}")
+            print(f"  - secret_access_key: {'configured' if cfg['secret_access_key'] else 'not configured'}")
+            print(f"  - endpoint_url: {'configured' if cfg['endpoint_url'] else 'not configured'}")
 
+        self._has_remote_cached = has_config
         return has_config
 
     def _create_remote_backend(self) -> Optional[StorageBackend]:
         """Create remote storage backend"""
         try:
-            from trendradar.storage.remote import RemoteStorageBackend
-
-            return RemoteStorageBackend(
-                bucket_name=self.remote_config.get("bucket_name") or os.environ.get("S3_BUCKET_NAME", ""),
-                access_key_id=self.remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
-                secret_access_key=self.remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
-                endpoint_url=self.remote_config.get("endpoint_url") or os.environ.get("S3_ENDPOINT_URL", ""),
-                region=self.remote_config.get("region") or os.environ.get("S3_REGION", ""),
+            remote_cls = _get_remote_backend_cls()
+
+            self._has_remote_config()  # ensure remote config is resolved
+            return remote_cls(
+                **self._resolved_remote_config,
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
@@ -146,23 +203,38 @@ class StorageManager:
             print(f"[Storage Manager] Remote backend initialization failed: {e}")
             return None
 
+    def _ensure_remote_backend(self) -> None:
+        """Set up the remote backend, reusing the main backend if it is already remote"""
+        if self._remote_backend is not None:
+            return
+        if self._backend is not None and self._backend.backend_name == "remote":
+            self._remote_backend = self._backend
+        else:
+            self._remote_backend = self._create_remote_backend()
+
     def get_backend(self) -> StorageBackend:
         """Get storage backend instance"""
-        if self._backend is None:
+        return self._backend if self._backend is not None else self._init_backend()
+
+    def _init_backend(self) -> StorageBackend:
+        """Resolve and create the storage backend (runs once, guarded against concurrent init)"""
+        with self._backend_lock:
+            if self._backend is not None:
+                return self._backend
+
+            backend: Optional[StorageBackend] = None
             resolved_type = self._resolve_backend_type()
 
             if resolved_type == "remote":
-                self._backend = self._create_remote_backend()
-                if self._backend:
+                backend = self._create_remote_backend()
+                if backend:
                     print(f"[Storage Manager] Using remote storage backend")
                 else:
                     print("[Storage Manager] Falling back to local storage")
                     resolved_type = "local"
 
-            if resolved_type == "local" or self._backend is None:
-                from trendradar.storage.local import LocalStorageBackend
-
-                self._backend = LocalStorageBackend(
+            if resolved_type == "local" or backend is None:
+                backend = _get_local_backend_cls()(
                     data_dir=self.data_dir,
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
@@ -170,7 +242,12 @@ class StorageManager:
                 )
                 print(f"[Storage Manager] Using local storage backend (data dir: {self.data_dir})")
 
-        return self._backend
+            # Skip the get_backend() indirection on every later wrapper call
+            for name in self._FORWARDED_METHODS:
+                setattr(self, name, getattr(backend, name))
+
+            self._backend = backend
+            return backend
 
     def pull_from_remote(self) -> int:
         """
@@ -187,8 +264,7 @@ class StorageManager:
             return 0
 
         # Create remote backend if not exists
-        if self._remote_backend is None:
-            self._remote_backend = self._create_remote_backend()
+        self._ensure_remote_backend()
 
         if self._remote_backend is None:
             print("[Storage Manager] Cannot create remote backend, pull failed")
@@ -217,6 +293,10 @@ class StorageManager:
         """Save TXT snapshot"""
         return self.get_backend().save_txt_snapshot(data)
 
+    def get_txt_snapshot_path(self, data: NewsData) -> Optional[str]:
+        """Get local TXT snapshot path (without writing)"""
+        return self.get_backend().get_txt_snapshot_path(data)
+
     def save_html_report(self, html_content: str, filename: str, is_summary: bool = False) -> Optional[str]:
         """Save HTML report"""
         return self.get_backend().save_html_report(html_content, filename, is_summary)
@@ -229,7 +309,7 @@ class StorageManager:
         """Cleanup resources"""
         if self._backend:
             self._backend.cleanup()
-        if self._remote_backend:
+        if self._remote_backend and self._remote_backend is not self._backend:
             self._remote_backend.cleanup()
 
     def cleanup_old_data(self) -> int:
@@ -247,8 +327,7 @@ class StorageManager:
 
         # Cleanup remote data (if configured)
         if self.remote_retention_days > 0 and self._has_remote_config():
-            if self._remote_backend is None:
-                self._remote_backend = self._create_remote_backend()
+            self._ensure_remote_backend()
             if self._remote_backend:
                 total_deleted += self._remote_backend.cleanup_old_data(self.remote_retention_days)
 
@@ -327,17 +406,20 @@ def get_storage_manager(
     global _storage_manager
 
     if _storage_manager is None or force_new:
-        _storage_manager = StorageManager(
-            backend_type=backend_type,
-            data_dir=data_dir,
-            enable_txt=enable_txt,
-            enable_html=enable_html,
-            remote_config=remote_config,
-            local_retention_days=local_retention_days,
-            remote_retention_days=remote_retention_days,
-            pull_enabled=pull_enabled,
-            pull_days=pull_days,
-            timezone=timezone,
-        )
+        # Double-checked locking: concurrent first callers share one instance
+        with _storage_manager_lock:
+            if _storage_manager is None or force_new:
+                _storage_manager = StorageManager(
+                    backend_type=backend_type,
+                    data_dir=data_dir,
+                    enable_txt=enable_txt,
+                    enable_html=enable_html,
+                    remote_config=remote_config,
+                    local_retention_days=local_retention_days,
+                    remote_retention_days=remote_retention_days,
+                    pull_enabled=pull_enabled,
+                    pull_days=pull_days,
+                    timezone=timezone,
+                )
 
     return _storage_manager
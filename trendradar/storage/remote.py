@@ -15,7 +15,7 @@ import tempfile
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import boto3
@@ -37,6 +37,10 @@ from trendradar.utils.time import (
 from trendradar.utils.url import normalize_url
 
 
+# S3 客户端缓存：相同凭据和端点的后端实例复用同一客户端（及其连接池）
+_S3_CLIENTS: Dict[Tuple, Any] = {}
+
+
 class RemoteStorageBackend(StorageBackend):
     """
     远程云存储后端（S3 兼容协议）
@@ -98,21 +102,26 @@ class RemoteStorageBackend(StorageBackend):
         is_tencent_cos = "myqcloud.com" in endpoint_url.lower()
         signature_version = 's3' if is_tencent_cos else 's3v4'
 
-        s3_config = BotoConfig(
-            s3={"addressing_style": "virtual"},
-            signature_version=signature_version,
-        )
-
-        client_kwargs = {
-            "endpoint_url": endpoint_url,
-            "aws_access_key_id": access_key_id,
-            "aws_secret_access_key": secret_access_key,
-            "config": s3_config,
-        }
-        if region:
-            client_kwargs["region_name"] = region
-
-        self.s3_client = boto3.client("s3", **client_kwargs)
+        client_key = (endpoint_url, access_key_id, secret_access_key, region, signature_version)
+        s3_client = _S3_CLIENTS.get(client_key)
+        if s3_client is None:
+            s3_config = BotoConfig(
+                s3={"addressing_style": "virtual"},
+                signature_version=signature_version,
+            )
+
+            client_kwargs = {
+                "endpoint_url": endpoint_url,
+                "aws_access_key_id": access_key_id,
+                "aws_secret_access_key": secret_access_key,
+                "config": s3_config,
+            }
+            if region:
+                client_kwargs["region_name"] = region
+
+            s3_client = boto3.client("s3", **client_kwargs)
+            _S3_CLIENTS[client_key] = s3_client
+        self.s3_client = s3_client
 
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""
+HTTP 重试工具模块
+
+提供带上限的指数退避（full jitter）重试：
+- backoff_delay: 计算第 N 次重试的等待时间
+- retry_get: 对瞬时错误（超时、连接错误、429/5xx）自动重试的 GET 请求
+"""
+
+import random
+import time
+from typing import Optional
+
+import requests
+
+
+# 可重试的 HTTP 状态码（限流与服务端错误），4xx 鉴权类错误不重试
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 头（仅支持秒数格式）"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retry_after: Optional[str] = None,
+) -> float:
+    """
+    计算重试等待时间
+
+    Args:
+        attempt: 已失败次数（从 0 开始）
+        base: 基础等待时间（秒），每次失败翻倍
+        cap: 等待时间上限（秒）
+        retry_after: 服务端返回的 Retry-After 头（可选，优先使用）
+
+    Returns:
+        等待秒数，取值于 [0, min(cap, base * 2^attempt)]
+    """
+    server_delay = _parse_retry_after(retry_after)
+    if server_delay is not None:
+        return min(cap, server_delay)
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_get(
+    session,
+    url: str,
+    *,
+    max_attempts: int = 4,
+    base: float = 1.0,
+    cap: float = 30.0,
+    **kwargs,
+) -> requests.Response:
+    """
+    发送 GET 请求，瞬时错误时按指数退避重试
+
+    仅对超时、连接错误和 429/5xx 响应重试；其他响应直接返回给调用方处理。
+
+    Args:
+        session: requests.Session（或任何提供 get 方法的对象）
+        url: 请求地址
+        max_attempts: 最大尝试次数（含首次请求）
+        base: 退避基础等待时间（秒）
+        cap: 退避等待上限（秒）
+        **kwargs: 透传给 session.get 的参数
+
+    Returns:
+        最后一次请求的响应
+
+    Raises:
+        requests.Timeout / requests.ConnectionError: 重试耗尽后抛出最后一次异常
+    """
+    for attempt in range(max_attempts):
+        is_last = attempt == max_attempts - 1
+        try:
+            response = session.get(url, **kwargs)
+        except (requests.Timeout, requests.ConnectionError):
+            if is_last:
+                raise
+            time.sleep(backoff_delay(attempt, base, cap))
+            continue
+
+        if response.status_code in RETRYABLE_STATUS_CODES and not is_last:
+            delay = backoff_delay(
+                attempt, base, cap, response.headers.get("Retry-After")
+            )
+            response.close()
+            time.sleep(delay)
+            continue
+
+        return response